@@ -116,19 +116,13 @@ class BaseDatabase(SQLiteDB):
         if obs_type:
             query += " AND obs_type = ?"
             params.append(obs_type)
+        if check_receipt in ["gdas", "gfs"]:
+            # Only keep files received after the cutoff of the requested run
+            query += " AND receipt_time > ?"
+            params.append(window_end - timedelta(minutes=minutes_behind_realtime[check_receipt]))
 
         results = self.execute_query(query, tuple(params))
-        valid_files = []
-        for row in results:
-            filename = row[0]
-            if check_receipt in ["gdas", "gfs"]:
-                query = "SELECT receipt_time FROM obs_files WHERE filename = ?"
-                receipt_time = self.execute_query(query, (filename,))[0][0]
-                receipt_time = datetime.strptime(receipt_time, "%Y-%m-%d %H:%M:%S.%f")
-                if receipt_time <= window_end - timedelta(minutes=minutes_behind_realtime[check_receipt]):
-                    continue
-
-            valid_files.append(filename)
+        valid_files = [filename for filename, in results]
 
         # Copy files to the destination directory
         dst_files = []
@@ -7,8 +7,7 @@ from pyobsforge.task.providers import ProviderConfig
 from multiprocessing import Process, Manager
 from os.path import join
 from datetime import timedelta
-import glob
-from os.path import basename
+import os
 import pathlib
 
 logger = getLogger(__name__.split('.')[-1])
@@ -95,7 +94,7 @@ class MarineObsPrep(Task):
                           provider: str,
                           obs_space: str,
                           shared_ioda_files) -> None:
-        output_file = f"{self.task_config['RUN']}.t{self.task_config['cyc']:02d}z.{obs_space}.nc"
+        output_file = f"{self.task_config['PREFIX']}{obs_space}.nc"
 
         # Process GHRSST
         if provider == "ghrsst":
@@ -258,22 +257,22 @@ class MarineObsPrep(Task):
                       f"{self.task_config['cyc']:02d}",
                       'ocean')
 
-        # Loop through the observation types
+        # List the ioda files in DATA once, rather than globbing it for every obs type
+        prefix = self.task_config['PREFIX']
+        with os.scandir(self.task_config['DATA']) as it:
+            ioda_files = [entry.name for entry in it
+                          if entry.name.startswith(prefix) and entry.name.endswith('.nc') and entry.is_file()]
+
+        # Create the destination directories
         obs_types = ['sst', 'adt', 'icec', 'sss']
-        src_dst_obs_list = []  # list of [src_file, dst_file]
-        for obs_type in obs_types:
-            # Create the destination directory
-            comout_tmp = join(comout, obs_type)
-            FileHandler({'mkdir': [comout_tmp]}).sync()
-
-            # Glob the ioda files
-            ioda_files = glob.glob(join(self.task_config['DATA'],
-                                        f"{self.task_config['PREFIX']}*{obs_type}_*.nc"))
-            for ioda_file in ioda_files:
-                logger.info(f"ioda_file: {ioda_file}")
-                src_file = ioda_file
-                dst_file = join(comout_tmp, basename(ioda_file))
-                src_dst_obs_list.append([src_file, dst_file])
+        comout_dirs = {obs_type: join(comout, obs_type) for obs_type in obs_types}
+        FileHandler({'mkdir': list(comout_dirs.values())}).sync()
+
+        # Select the ioda files matching {PREFIX}*{obs_type}_*.nc for each observation type
+        src_dst_obs_list = [[join(self.task_config['DATA'], ioda_file), join(comout_tmp, ioda_file)]
+                            for obs_type, comout_tmp in comout_dirs.items()
+                            for ioda_file in ioda_files
+                            if f"{obs_type}_" in ioda_file[len(prefix):]]
 
         logger.info("Copying ioda files to destination COMROOT directory")
         logger.info(f"src_dst_obs_list: {src_dst_obs_list}")
@@ -281,5 +280,5 @@ class MarineObsPrep(Task):
         FileHandler({'copy': src_dst_obs_list}).sync()
 
         # create an empty file to tell external processes the obs are ready
-        ready_file = pathlib.Path(join(comout, f"{self.task_config['PREFIX']}obsforge_marine_status.log"))
+        ready_file = pathlib.Path(join(comout, f"{prefix}obsforge_marine_status.log"))
         ready_file.touch()
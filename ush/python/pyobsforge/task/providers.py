@@ -1,11 +1,4 @@
 from logging import getLogger
-from pyobsforge.obsdb.ghrsst_db import GhrSstDatabase
-from pyobsforge.obsdb.rads_db import RADSDatabase
-from pyobsforge.obsdb.nesdis_amsr2_db import NesdisAmsr2Database
-from pyobsforge.obsdb.nesdis_mirs_db import NesdisMirsDatabase
-from pyobsforge.obsdb.nesdis_jpssrr_db import NesdisJpssrrDatabase
-from pyobsforge.obsdb.smap_db import SmapDatabase
-from pyobsforge.obsdb.smos_db import SmosDatabase
 from typing import Any
 from dataclasses import dataclass
 from wxflow import AttrDict
@@ -54,20 +47,32 @@ class ProviderConfig:
         self.db = db
         self.ocean_basin = ocean_basin
 
+        # QC settings passed to the ioda converter, identical for every obs space
+        self._qc_context = {'bounds_min': qc_config.bounds_min,
+                            'bounds_max': qc_config.bounds_max,
+                            'binning_stride': qc_config.binning_stride,
+                            'binning_min_number_of_obs': qc_config.binning_min_number_of_obs,
+                            'error_ratio': qc_config.error_ratio}
+
     @classmethod
     def from_task_config(cls, provider_name: str, task_config: AttrDict) -> "ProviderConfig":
         qc_raw = task_config.providers[provider_name]["qc config"]
         qc = QCConfig.from_dict(qc_raw)
 
-        print(f"@@@@@@@@@@@@@@@@@@@@@@@@ provider: {provider_name}")
+        logger.debug(f"Setting up provider: {provider_name}")
 
+        # Only import the database class of the requested provider
         if provider_name == "ghrsst":
+            from pyobsforge.obsdb.ghrsst_db import GhrSstDatabase
             db = GhrSstDatabase(db_name=f"{provider_name}.db", dcom_dir=task_config.DCOMROOT, obs_dir="sst")
         elif provider_name == "rads":
+            from pyobsforge.obsdb.rads_db import RADSDatabase
             db = RADSDatabase(db_name=f"{provider_name}.db", dcom_dir=task_config.DCOMROOT, obs_dir="wgrdbul/adt")
         elif provider_name == "nesdis_amsr2":
+            from pyobsforge.obsdb.nesdis_amsr2_db import NesdisAmsr2Database
             db = NesdisAmsr2Database(db_name=f"{provider_name}.db", dcom_dir=task_config.DCOMROOT, obs_dir="seaice/pda")
         elif provider_name == "nesdis_mirs":
+            from pyobsforge.obsdb.nesdis_mirs_db import NesdisMirsDatabase
             obs_dirs = [
                 "seaice_amsu",
                 "seaice_atms_j1",
@@ -77,10 +82,13 @@ class ProviderConfig:
             ]
             db = NesdisMirsDatabase(db_name=f"{provider_name}.db", dcom_dir=task_config.DCOMROOT, obs_dirs=obs_dirs)
         elif provider_name == "nesdis_jpssrr":
+            from pyobsforge.obsdb.nesdis_jpssrr_db import NesdisJpssrrDatabase
             db = NesdisJpssrrDatabase(db_name=f"{provider_name}.db", dcom_dir=task_config.DCOMROOT, obs_dir="wgrdbul/IST")
         elif provider_name == "smap":
+            from pyobsforge.obsdb.smap_db import SmapDatabase
             db = SmapDatabase(db_name=f"{provider_name}.db", dcom_dir=task_config.DCOMROOT, obs_dir="wtxtbul/satSSS/SMAP")
         elif provider_name == "smos":
+            from pyobsforge.obsdb.smos_db import SmosDatabase
             db = SmosDatabase(db_name=f"{provider_name}.db", dcom_dir=task_config.DCOMROOT, obs_dir="wtxtbul/satSSS/SMOS")
         else:
             raise NotImplementedError(f"DB setup for provider {provider_name} not yet implemented")
@@ -134,7 +142,8 @@ class ProviderConfig:
         # Process the observations if the obs space is not empty
         if len(input_files) > 0:
             # Configure the ioda converter
-            context = {'provider': provider.upper(),
+            context = {**self._qc_context,
+                       'provider': provider.upper(),
                        'window_begin': yaml_window_begin,
                        'window_end': yaml_window_end,
                        'input_files': input_files,
@@ -144,17 +153,6 @@ class ProviderConfig:
             if getattr(self, "ocean_basin", None):
                 context["ocean_basin"] = self.ocean_basin
 
-            # Only add QC config attributes if they exist
-            if hasattr(self.qc_config, 'bounds_min'):
-                context['bounds_min'] = self.qc_config.bounds_min
-            if hasattr(self.qc_config, 'error_ratio'):
-                context['error_ratio'] = self.qc_config.error_ratio
-            if hasattr(self.qc_config, 'bounds_max'):
-                context['bounds_max'] = self.qc_config.bounds_max
-            if hasattr(self.qc_config, 'binning_stride'):
-                context['binning_stride'] = self.qc_config.binning_stride
-            if hasattr(self.qc_config, 'binning_min_number_of_obs'):
-                context['binning_min_number_of_obs'] = self.qc_config.binning_min_number_of_obs
             result = run_nc2ioda(task_config, obs_space, context)
             logger.info(f"run_nc2ioda result: {result}")
         else:
@@ -1,10 +1,25 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
-from wxflow import Task, AttrDict, add_to_datetime, to_timedelta, FileHandler
+from wxflow import Task, AttrDict, add_to_datetime, to_timedelta, FileHandler, cp
 
 logger = getLogger(__name__.split('.')[-1])
 
 
+def _list_dir(path):
+    """
+    Return the set of entry names in a directory, or an empty set if it does not exist.
+
+    Args:
+        path (str): Directory to list.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except FileNotFoundError:
+        return set()
+
+
 class StageOutput(Task):
     """
     Task to create output directories and stage files from other jobs
@@ -19,36 +34,26 @@ class StageOutput(Task):
             config (AttrDict): Configuration dictionary for the task.
         """
         super().__init__(config)
-        _window_begin = add_to_datetime(self.task_config.current_cycle, -to_timedelta(f"{self.task_config['assim_freq']}H") / 2)
-        _window_end = add_to_datetime(self.task_config.current_cycle, +to_timedelta(f"{self.task_config['assim_freq']}H") / 2)
+        current_cycle = self.task_config.current_cycle
+        run = self.task_config.RUN
+
+        _window_begin = add_to_datetime(current_cycle, -to_timedelta(f"{self.task_config['assim_freq']}H") / 2)
+        _window_end = add_to_datetime(current_cycle, +to_timedelta(f"{self.task_config['assim_freq']}H") / 2)
+
+        # Shared path segments of the COM directories
+        cyc = f"{self.task_config.cyc:02d}"
+        run_ymd = f"{run}.{current_cycle.strftime('%Y%m%d')}"
+        com_base = os.path.join(self.task_config['COMROOT'], self.task_config['PSLOT'])
 
         local_dict = AttrDict(
             {
                 'window_begin': _window_begin,
                 'window_end': _window_end,
-                'OPREFIX': f"{self.task_config.RUN}.t{self.task_config.cyc:02d}z.",
-                'COMIN_ATMOS_GSI': os.path.join(self.task_config['COMROOT'],
-                                                self.task_config['PSLOT'],
-                                                f"{self.task_config.RUN}.{self.task_config.current_cycle.strftime('%Y%m%d')}",
-                                                f"{self.task_config.cyc:02d}",
-                                                'atmos_gsi'),
-                'COMIN_ATMOS_OBSFORGE': os.path.join(self.task_config['COMROOT'],
-                                                     self.task_config['PSLOT'],
-                                                     f"{self.task_config.RUN}.{self.task_config.current_cycle.strftime('%Y%m%d')}",
-                                                     f"{self.task_config.cyc:02d}",
-                                                     'atmos'),
-                'COMOUT_ATMOS_OBS': os.path.join(self.task_config['COMROOT'],
-                                                 self.task_config['PSLOT'],
-                                                 'output_obs',
-                                                 f"{self.task_config.RUN}.{self.task_config.current_cycle.strftime('%Y%m%d')}",
-                                                 f"{self.task_config.cyc:02d}",
-                                                 'atmos'),
-                'COMOUT_ATMOS_BC': os.path.join(self.task_config['COMROOT'],
-                                                self.task_config['PSLOT'],
-                                                'output_bc',
-                                                f"{self.task_config.RUN}.{self.task_config.current_cycle.strftime('%Y%m%d')}",
-                                                f"{self.task_config.cyc:02d}",
-                                                'analysis', 'atmos'),
+                'OPREFIX': f"{run}.t{cyc}z.",
+                'COMIN_ATMOS_GSI': os.path.join(com_base, run_ymd, cyc, 'atmos_gsi'),
+                'COMIN_ATMOS_OBSFORGE': os.path.join(com_base, run_ymd, cyc, 'atmos'),
+                'COMOUT_ATMOS_OBS': os.path.join(com_base, 'output_obs', run_ymd, cyc, 'atmos'),
+                'COMOUT_ATMOS_BC': os.path.join(com_base, 'output_bc', run_ymd, cyc, 'analysis', 'atmos'),
             }
         )
 
@@ -68,73 +73,93 @@ class StageOutput(Task):
         """
         logger.info("Starting the staging of output files.")
 
+        oprefix = self.task_config.OPREFIX
+        comin_atmos_gsi = self.task_config.COMIN_ATMOS_GSI
+        comin_atmos_obsforge = self.task_config.COMIN_ATMOS_OBSFORGE
+        comout_atmos_obs = self.task_config.COMOUT_ATMOS_OBS
+
         copy_list = []
         obs_source_log = []  # Track observation names and their sources
+        src_listings = {}  # Names of the files in each source directory, listed once per directory
+
+        # Directories joined with the file prefix once; the loop only appends the observation names
+        gsi_prefix = os.path.join(comin_atmos_gsi, oprefix)
+        bufr_prefix = os.path.join(comin_atmos_obsforge, oprefix)
+        out_prefix = os.path.join(comout_atmos_obs, oprefix)
 
         for obs in self.task_config.observations:
             obs_name = obs.get('name')
             obs_source = obs.get('source')
 
             if obs_source == 'GSI':
-                src_dir = self.task_config.COMIN_ATMOS_GSI
+                src_dir = comin_atmos_gsi
+                src_prefix = gsi_prefix
                 src_suffix = '.gsi.nc'
             elif obs_source == 'BUFR':
-                src_dir = self.task_config.COMIN_ATMOS_OBSFORGE
+                src_dir = comin_atmos_obsforge
+                src_prefix = bufr_prefix
                 src_suffix = '.nc'
             else:
                 logger.warning(f"Unknown source type '{obs_source}' for observation '{obs_name}'. Skipping.")
                 continue
 
-            src_file = os.path.join(src_dir, f"{self.task_config.OPREFIX}{obs_name}{src_suffix}")
-            dest_file = os.path.join(self.task_config.COMOUT_ATMOS_OBS, f"{self.task_config.OPREFIX}{obs_name}.nc")
+            if src_dir not in src_listings:
+                src_listings[src_dir] = _list_dir(src_dir)
 
-            if os.path.exists(src_file):
+            src_name = f"{oprefix}{obs_name}{src_suffix}"
+            src_file = f"{src_prefix}{obs_name}{src_suffix}"
+            dest_file = f"{out_prefix}{obs_name}.nc"
+
+            if src_name in src_listings[src_dir]:
                 copy_list.append([src_file, dest_file])
-                obs_source_log.append((f"{self.task_config.OPREFIX}{obs_name}.nc", obs_source))
+                obs_source_log.append((f"{oprefix}{obs_name}.nc", obs_source))
                 logger.info(f"Staging {obs_name} from {src_file} to {dest_file}")
             else:
                 logger.warning(f"Source file not found for observation '{obs_name}': {src_file}")
 
-        if copy_list:
-            FileHandler({'mkdir': [self.task_config.COMOUT_ATMOS_OBS], 'copy': copy_list}).sync()
-            logger.info(f"Copied {len(copy_list)} observation files to {self.task_config.COMOUT_ATMOS_OBS}")
-
-            # Write observation source log file
-            log_file_path = os.path.join(self.task_config.COMOUT_ATMOS_OBS,
-                                         f"{self.task_config.OPREFIX}observation_source.log")
-            with open(log_file_path, 'w') as log_file:
-                log_file.write("# Observation Source Log\n")
-                log_file.write("# File Name, Source\n")
-                for filename, source in obs_source_log:
-                    log_file.write(f"{filename}, {source}\n")
-            logger.info(f"Wrote observation source log to {log_file_path}")
-
-        else:
-            logger.warning("No observation files were copied.")
+        n_obs_files = len(copy_list)
+        mkdir_list = [comout_atmos_obs]
 
         # Copy obsforge BUFR status log file
-        bufr_status_log_src = os.path.join(self.task_config.COMIN_ATMOS_OBSFORGE,
-                                           "obsforge_atmos_bufr_status.log")
-        bufr_status_log_dest = os.path.join(self.task_config.COMOUT_ATMOS_OBS,
-                                            "obsforge_atmos_bufr_status.log")
+        bufr_status_log_src = os.path.join(comin_atmos_obsforge, "obsforge_atmos_bufr_status.log")
+        bufr_status_log_dest = os.path.join(comout_atmos_obs, "obsforge_atmos_bufr_status.log")
         if os.path.exists(bufr_status_log_src):
-            FileHandler({'copy': [[bufr_status_log_src, bufr_status_log_dest]]}).sync()
-            logger.info(f"Copied BUFR status log from {bufr_status_log_src} to {bufr_status_log_dest}")
+            copy_list.append([bufr_status_log_src, bufr_status_log_dest])
+            logger.info(f"Staging BUFR status log from {bufr_status_log_src} to {bufr_status_log_dest}")
         else:
             logger.warning(f"BUFR status log file not found: {bufr_status_log_src}")
 
         # Copy bias correction files if source is GSI
         bias_correction_config = self.task_config.get('bias correction', {})
         if bias_correction_config.get('source') == 'GSI':
-            bc_src_file = os.path.join(self.task_config.COMIN_ATMOS_GSI,
-                                       f"{self.task_config.OPREFIX}rad_varbc_params.tar")
-            bc_dest_file = os.path.join(self.task_config.COMOUT_ATMOS_BC,
-                                        f"{self.task_config.OPREFIX}rad_varbc_params.tar")
+            bc_src_file = os.path.join(comin_atmos_gsi, f"{oprefix}rad_varbc_params.tar")
+            bc_dest_file = os.path.join(self.task_config.COMOUT_ATMOS_BC, f"{oprefix}rad_varbc_params.tar")
             if os.path.exists(bc_src_file):
-                FileHandler({'mkdir': [self.task_config.COMOUT_ATMOS_BC],
-                             'copy': [[bc_src_file, bc_dest_file]]}).sync()
-                logger.info(f"Copied bias correction file from {bc_src_file} to {bc_dest_file}")
+                mkdir_list.append(self.task_config.COMOUT_ATMOS_BC)
+                copy_list.append([bc_src_file, bc_dest_file])
+                logger.info(f"Staging bias correction file from {bc_src_file} to {bc_dest_file}")
             else:
                 logger.warning(f"Bias correction file not found: {bc_src_file}")
 
+        # Create the output directories once and copy everything in a single pass.
+        # Copies are latency bound on the shared file systems, so overlap them with a bounded pool
+        if copy_list:
+            FileHandler({'mkdir': mkdir_list}).sync()
+            max_workers = int(self.task_config.get('OBSFORGE_COPY_CONCURRENCY', 8))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(lambda src_dest: cp(*src_dest), copy_list))
+
+        if n_obs_files > 0:
+            logger.info(f"Copied {n_obs_files} observation files to {comout_atmos_obs}")
+
+            # Write observation source log file
+            log_file_path = os.path.join(comout_atmos_obs, f"{oprefix}observation_source.log")
+            lines = ["# Observation Source Log\n", "# File Name, Source\n"]
+            lines.extend(f"{filename}, {source}\n" for filename, source in obs_source_log)
+            with open(log_file_path, 'w') as log_file:
+                log_file.write(''.join(lines))
+            logger.info(f"Wrote observation source log to {log_file_path}")
+        else:
+            logger.warning("No observation files were copied.")
+
         logger.info("Completed the staging of output files.")
@@ -10,15 +10,15 @@ import pytest
 from pyobsforge.obsdb.nesdis_amsr2_db import NesdisAmsr2Database  # Adjust as needed
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_obs_dir():
     """Create a temp directory with mock NESDIS AMSR2 NetCDF files."""
     base_dir = tempfile.mkdtemp()
     sub_dir = os.path.join(base_dir, "some_subdir", "seaice/pda")
     os.makedirs(sub_dir)
 
-    # Desired datetime for file timestamps
-    mock_time = datetime(2025, 3, 16, 0, 0, 0).timestamp()
+    # Desired datetime for file timestamps, in nanoseconds for os.utime
+    mock_ns = int(datetime(2025, 3, 16, 0, 0, 0).timestamp() * 1e9)
 
     # Create mock NetCDF files
     filenames = [
@@ -56,15 +56,15 @@ def temp_obs_dir():
     ]
     for fname in filenames:
         fname_tmp = os.path.join(sub_dir, fname)
-        with open(fname_tmp, "w") as f:
-            f.write("fake content")
-        os.utime(fname_tmp, (mock_time, mock_time))  # (access_time, modification_time)
+        # Only the names and timestamps matter, so leave the files empty
+        os.close(os.open(fname_tmp, os.O_CREAT | os.O_WRONLY, 0o644))
+        os.utime(fname_tmp, ns=(mock_ns, mock_ns))  # (access_time, modification_time)
 
     yield base_dir
     shutil.rmtree(base_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def db(temp_obs_dir):
     """Initialize test database."""
     db_path = os.path.join(temp_obs_dir, "nesdis_amsr2_test.db")
@@ -37,17 +37,18 @@ class NDBCIODAVariables(IODAVariables):
         return q
     
     def set_obs_from_query_result(self, r):
+        # kept in Kelvin here, converted in filter once the rejected reports are gone
         self.temp = r.get('temp')
-        self.temp -= 273.15
 
     def filter(self):
         super().filter()
         tropical_mask = ~is_tropical_mooring(self.metadata.stationID)
-        knwb_mask = [True if org == 'KWNB' else False for org in self.metadata.borg]
+        knwb_mask = np.ma.filled(self.metadata.borg, '') == 'KWNB'
         temp_mask = ~self.temp.mask
         mask = tropical_mask & knwb_mask & temp_mask
         self.metadata.filter(mask)
         self.temp = self.temp[mask]
+        self.temp -= 273.15
 
     def write_to_ioda_file(self, obsspace):
         self.metadata.write_to_ioda_file(obsspace)
@@ -111,9 +112,10 @@ class NDBCAdditionalVariables(IODAAdditionalVariables):
 
     def construct(self):
         n = len(self.ioda_vars.metadata.lon)
-        self.PreQC = (np.ma.masked_array(np.full(n, 0))).astype(np.int32)
+        # allocate directly in the output dtypes; the writers need masked arrays for fill_value
+        self.PreQC = np.ma.masked_array(np.zeros(n, dtype=np.int32))
         self.ObsError_temp = \
-            np.float32(np.ma.masked_array(np.full(n, self.ioda_vars.T_error)))
+            np.ma.masked_array(np.full(n, self.ioda_vars.T_error, dtype=np.float32))
         self.compute_ocean_basin()
 
     def write_to_ioda_file(self, obsspace):
@@ -208,17 +208,23 @@ RAMA = [
     1400046
 ]
 
+# numpy copies of the lists above, for vectorized membership tests
+_RAMA = np.array(RAMA, dtype=np.int64)
+_PIRATA = np.array(PIRATA, dtype=np.int64)
+_TAO_TRITON = np.array(TAO_TRITON, dtype=np.int64)
+_TROPICAL_MOORINGS = np.concatenate([_RAMA, _PIRATA, _TAO_TRITON])
+
+def _station_ids_as_int(stationID):
+    return np.asarray(stationID).astype(np.int64)
+
 def is_rama(stationID):
-    return [True if int(rpid) in RAMA else False for rpid in stationID]
+    return np.isin(_station_ids_as_int(stationID), _RAMA)
 
 def is_pirata(stationID):
-    return [True if int(rpid) in PIRATA else False for rpid in stationID]
+    return np.isin(_station_ids_as_int(stationID), _PIRATA)
 
 def is_taotriton(stationID):
-    return [True if int(rpid) in TAO_TRITON else False for rpid in stationID]
+    return np.isin(_station_ids_as_int(stationID), _TAO_TRITON)
 
 def is_tropical_mooring(stationID):
-    mr = is_rama(stationID)
-    mp = is_pirata(stationID)
-    mt = is_taotriton(stationID)
-    return np.logical_or.reduce([mr, mp, mt])
+    return np.isin(_station_ids_as_int(stationID), _TROPICAL_MOORINGS)